@@ -9,7 +9,7 @@ to a pre-defined list of Telegram users.
 
 # This makes the TelegramNotifier class available for import directly from the package.
 # So you can do `from notifier_pkg import TelegramNotifier`
-from .notifier import TelegramNotifier
+from .notifier import TelegramNotifier, install_fast_loop
 
 __version__ = "1.0.1"
 __author__ = "Rtamanyu N. J."
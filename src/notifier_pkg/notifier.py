@@ -8,18 +8,162 @@ git push origin v<version>
 """
 
 import os
+import re
+import json
+import time
 import asyncio
 import logging
-from typing import List, Union
+from datetime import timedelta
+from typing import Awaitable, Coroutine, Dict, Iterator, Optional, Sequence, Tuple, Union
 
 # We will use the python-telegram-bot library, which is a popular choice.
 # It will be installed automatically via the setup.cfg file.
 import telegram
-from telegram.error import TelegramError
+from telegram.error import BadRequest, Forbidden, NetworkError, RetryAfter, TelegramError
+from telegram.request import HTTPXRequest
 
-# Set up basic logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# aiohttp is an optional dependency, only needed for backend="aiohttp".
+# Install it with `pip install telegram-notifier-pkg[aiohttp]`.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# uvloop is an optional dependency, used by install_fast_loop().
+# Install it with `pip install telegram-notifier-pkg[uvloop]` (not available on Windows).
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# orjson is an optional dependency that speeds up encoding request bodies for the
+# aiohttp backend. Install it with `pip install telegram-notifier-pkg[orjson]`.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Logging configuration is left to the application using this package.
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# The HTTP connection pool is sized to at least this many connections so that
+# the concurrent fan-out in notify() never waits on a free connection.
+MIN_CONNECTION_POOL_SIZE = 32
+
+# Transport timeouts (seconds) for a single request to the Bot API.
+POOL_TIMEOUT = 10.0
+CONNECT_TIMEOUT = 5.0
+WRITE_TIMEOUT = 5.0
+READ_TIMEOUT = 15.0
+# Worst case a request can take before the transport gives up.
+REQUEST_TIMEOUT = POOL_TIMEOUT + CONNECT_TIMEOUT + WRITE_TIMEOUT + READ_TIMEOUT
+# Default hard bound per send attempt. It is above REQUEST_TIMEOUT so the transport
+# timeouts fire first and a slow but successful request is not cancelled halfway.
+DEFAULT_SEND_TIMEOUT = REQUEST_TIMEOUT + 5.0
+
+# Chats that blocked the bot or do not exist are skipped for this many seconds.
+DEAD_CHAT_COOLDOWN = 3600.0
+
+# Supported ways of talking to the Telegram Bot API.
+BACKENDS = ("ptb", "aiohttp")
+TELEGRAM_API_URL = "https://api.telegram.org/bot{token}/sendMessage"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Environment variables are read once at import time. If they are set after the
+# package was imported, TelegramNotifier falls back to reading them again.
+_BOT_TOKEN = os.getenv("TELEGRAM_NOTIFIER_BOT_TOKEN")
+_ALLOWED = os.getenv("TELEGRAM_NOTIFIER_ALLOWED_IDS")
+
+# Status header prepended to the message body for each notification level.
+_PREFIXES: Dict[int, str] = {
+    1: "ℹ️ [INFO]",
+    2: "⚠️ [WARNING]",
+    3: "❌ [ERROR]",
+}
+
+# Characters that have a meaning in Telegram's (legacy) Markdown parse mode.
+# Messages without any of them are sent as plain text.
+_MD_RE = re.compile(r'[*_`\[]')
+
+# A valid destination is a public username (@channel) or a numeric (possibly negative) chat ID.
+_ID_RE = re.compile(r'^(?:@[A-Za-z0-9_]{5,}|-?\d+)$')
+
+
+def install_fast_loop() -> bool:
+    """
+    Installs uvloop as the asyncio event loop policy, so that the HTTP I/O done by
+    notify() runs on uvloop's faster socket implementation. Call it before
+    asyncio.run(). Does nothing if uvloop is not installed.
+
+    Returns:
+        `bool`: True if uvloop was installed as the event loop policy, False otherwise.
+
+    Examples:
+        >>> from notifier_pkg import TelegramNotifier, install_fast_loop
+    >>> import asyncio
+    >>> install_fast_loop()
+    >>> notifier = TelegramNotifier()
+    >>> asyncio.run(notifier.notify("Deployment complete.", level=1))
+    """
+    if uvloop is None:
+        logger.info("uvloop is not installed. Keeping the default asyncio event loop.")
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def _parse_chat_id(chat_id: str) -> Union[str, int]:
+    """
+    Converts one entry of TELEGRAM_NOTIFIER_ALLOWED_IDS into a chat ID.
+    Usernames (@channel) and private channel IDs (-100...) are kept as strings,
+    user IDs (123...) are converted to int. Raises ValueError for anything else.
+    """
+    if not _ID_RE.match(chat_id):
+        raise ValueError(f"Invalid chat ID: '{chat_id}'")
+    return chat_id if chat_id.startswith(('@', '-')) else int(chat_id)
+
+
+def _json_dumps(obj) -> bytes:
+    """
+    Encodes `obj` as compact UTF-8 JSON, with orjson if available, else the json module.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _encode_message_body(text: str, parse_mode: Optional[str]) -> bytes:
+    """
+    JSON-encodes the part of a sendMessage request body that is the same for every
+    recipient, i.e. everything after the chat_id. The result starts with a comma and
+    ends with the closing brace, so a full body is `b'{"chat_id":' + <id> + result`.
+    """
+    payload = {"text": text}
+    if parse_mode:
+        payload["parse_mode"] = parse_mode
+    return b"," + _json_dumps(payload)[1:]
+
+
+def _spawn(coro: Coroutine) -> Awaitable:
+    """
+    Wraps `coro` in a Task that starts eagerly on Python 3.12+, so it runs
+    synchronously until its first real suspension instead of being scheduled
+    on the next loop iteration. On older versions a regular Task is created.
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        return asyncio.ensure_future(coro)
+    return eager_task_factory(asyncio.get_running_loop(), coro)
+
+
+def _chunked(items: Sequence, size: int) -> Iterator[Sequence]:
+    """
+    Yields consecutive slices of `items` containing at most `size` elements.
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 
 class TelegramNotifier:
     """
@@ -46,20 +190,52 @@ class TelegramNotifier:
     >>> notifier = TelegramNotifier()
     >>> asyncio.run(notifier.notify("Deployment complete.", level=1))
 
+        Reusing one process-wide notifier (recommended when notifying repeatedly):
+
+        >>> from notifier_pkg import TelegramNotifier
+    >>> notifier = await TelegramNotifier.get()
+    >>> await notifier.notify("Epoch 1 finished.", level=1)
+
     Notes:
         - The final message format is "<prefix>\\n\\n<message>" where prefix is one of:
             "ℹ️ [INFO]", "⚠️ [WARNING]", "❌ [ERROR]".
         - The function logs the number of destinations before sending and logs when all
             notifications have been sent.
+        - The underlying Bot and its HTTP connection pool are created once and reused by
+            every notify() call. Call `await notifier.aclose()` when you are done with it.
+        - Destinations are sent to in batches of `batch_size` with a pause of
+            `delay_between_batches` seconds between batches, to stay under Telegram's
+            rate limits when many chat IDs are configured.
+        - With backend="aiohttp", messages are posted directly to the Bot API through a
+            shared aiohttp session instead of going through python-telegram-bot's Bot.
+        - Chats that blocked the bot or do not exist are skipped for an hour. Other failures
+            (timeouts, network errors, ...) never cause a chat to be skipped.
+        - TelegramNotifier.get() returns a process-wide instance. Callers should reuse it
+            across notifications instead of creating a new notifier each time. The instance is
+            tied to the event loop it was created in; get() from another loop builds a new one.
+            A notifier created directly always has its own Bot and connection pool.
     """
-    def __init__(self):
+    _instance: Optional["TelegramNotifier"] = None
+    _instance_lock: Optional[asyncio.Lock] = None
+    _instance_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __init__(self, batch_size: int = 25, delay_between_batches: float = 1.0, backend: str = "ptb",
+                 send_timeout: float = DEFAULT_SEND_TIMEOUT):
         """
         Initializes the bot and checks for required environment variables.
+
+        Params:
+            `batch_size (int, optional)`: Maximum number of messages sent concurrently. Defaults to 25.
+            `delay_between_batches (float, optional)`: Seconds to wait between two batches. Defaults to 1.0.
+            `backend (str, optional)`: "ptb" (default) to send through python-telegram-bot, or
+               "aiohttp" to post directly to the Bot API (requires the optional aiohttp dependency).
+            `send_timeout (float, optional)`: Seconds after which a single send attempt is abandoned.
+               Defaults to 40.0, which is above the transport timeouts so those normally fire first.
         """
         logger.info("Initializing TelegramNotifier...")
         
-        self.bot_token = os.getenv("TELEGRAM_NOTIFIER_BOT_TOKEN")
-        allowed_ids_str = os.getenv("TELEGRAM_NOTIFIER_ALLOWED_IDS")
+        self.bot_token = _BOT_TOKEN or os.getenv("TELEGRAM_NOTIFIER_BOT_TOKEN")
+        allowed_ids_str = _ALLOWED or os.getenv("TELEGRAM_NOTIFIER_ALLOWED_IDS")
 
         if not self.bot_token:
             logger.error("FATAL: TELEGRAM_NOTIFIER_BOT_TOKEN environment variable not set.")
@@ -69,37 +245,166 @@ class TelegramNotifier:
             logger.error("FATAL: TELEGRAM_NOTIFIER_ALLOWED_IDS environment variable not set.")
             raise ValueError("TELEGRAM_NOTIFIER_ALLOWED_IDS is not configured.")
 
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+        self.batch_size = batch_size
+        self.delay_between_batches = delay_between_batches
+        self.send_timeout = send_timeout
+
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. Expected one of {BACKENDS}.")
+        if backend == "aiohttp" and aiohttp is None:
+            raise ImportError("backend='aiohttp' requires aiohttp. Install it with `pip install telegram-notifier-pkg[aiohttp]`.")
+        self.backend = backend
+
         # --- Process Allowed Chat and Channel IDs ---
         # The environment variable should be a comma-separated string.
         # e.g., "@my_public_channel,-100123456789,12345678"
         try:
-            # --- MODIFICATION ---
-            # This logic now handles usernames (@channel), private channel IDs (-100...), and user IDs (123...)
-            raw_ids = [chat_id.strip() for chat_id in allowed_ids_str.split(',')]
-            self.allowed_chat_ids: List[Union[str, int]] = []
-            for chat_id in raw_ids:
-                if chat_id.startswith('@') or chat_id.startswith('-'):
-                    self.allowed_chat_ids.append(chat_id) # Keep as string for channels
-                else:
-                    self.allowed_chat_ids.append(int(chat_id)) # Convert to int for users
-            
-            if not self.allowed_chat_ids:
+            # This handles usernames (@channel), private channel IDs (-100...), and user IDs (123...)
+            # Empty entries are ignored and duplicates are dropped, keeping the first occurrence.
+            parsed = [_parse_chat_id(chat_id) for chat_id in map(str.strip, allowed_ids_str.split(',')) if chat_id]
+            self.allowed_chat_ids: Tuple[Union[str, int], ...] = tuple(dict.fromkeys(parsed))
+            self._num_recipients = len(self.allowed_chat_ids)
+
+            if not self._num_recipients:
                 raise ValueError
-            logger.info(f"Notifier configured for {len(self.allowed_chat_ids)} channel(s)/user(s).")
+            if len(parsed) != self._num_recipients:
+                logger.warning("Ignored %s duplicate chat ID(s) in TELEGRAM_NOTIFIER_ALLOWED_IDS.", len(parsed) - self._num_recipients)
+            logger.info("Notifier configured for %s channel(s)/user(s).", self._num_recipients)
         except (ValueError, AttributeError):
-            logger.error(f"FATAL: TELEGRAM_ALLOWED_IDS is not a valid comma-separated list of IDs: '{allowed_ids_str}'")
+            logger.error("FATAL: TELEGRAM_ALLOWED_IDS is not a valid comma-separated list of IDs: '%s'", allowed_ids_str)
             raise ValueError("Invalid format for TELEGRAM_ALLOWED_IDS.")
 
-        self.bot = telegram.Bot(token=self.bot_token)
+        # A single long-lived request object (or aiohttp session) keeps connections alive
+        # between calls. The pool is large enough for every destination to be sent to concurrently.
+        self._pool_size = max(self._num_recipients, MIN_CONNECTION_POOL_SIZE)
+        self._session = None
+        if self.backend == "aiohttp":
+            # The session needs a running event loop, so it is created in _ensure_initialized().
+            self._api_url = TELEGRAM_API_URL.format(token=self.bot_token)
+            self._request = None
+            self.bot = None
+        else:
+            self._request = HTTPXRequest(
+                connection_pool_size=self._pool_size,
+                pool_timeout=POOL_TIMEOUT,
+                connect_timeout=CONNECT_TIMEOUT,
+                write_timeout=WRITE_TIMEOUT,
+                read_timeout=READ_TIMEOUT,
+            )
+            self.bot = telegram.Bot(token=self.bot_token, request=self._request)
+        self._initialized = False
+        # Created by _bind_loop() inside the running event loop: on Python < 3.10 they
+        # would otherwise bind to whatever get_event_loop() returns here.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._init_lock: Optional[asyncio.Lock] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        # Strong references to fire-and-forget tasks started by notify_threadsafe().
+        self._background_tasks = set()
+        # chat_id -> time.monotonic() until which sends to it are skipped.
+        # Only touched from the event loop between awaits, so it needs no lock.
+        self._blackhole: Dict[Union[str, int], float] = {}
         logger.info("Telegram Bot initialized successfully.")
 
+    @classmethod
+    async def get(cls, **kwargs) -> "TelegramNotifier":
+        """
+        Returns the process-wide notifier, creating it on first use.
+
+        The instance and its connections belong to the event loop it was created in.
+        When get() is called from a different event loop (e.g. a second asyncio.run()),
+        a new instance is built for that loop.
+
+        Params:
+            `**kwargs`: Passed to TelegramNotifier() when the instance is first created,
+               ignored afterwards.
+
+        Returns:
+            `TelegramNotifier`: The shared notifier instance.
+        """
+        loop = asyncio.get_running_loop()
+        if cls._instance_loop is not loop:
+            # Connections of an instance from another (usually closed) loop cannot be reused.
+            cls._instance = None
+            cls._instance_lock = asyncio.Lock()
+            cls._instance_loop = loop
+        if cls._instance is None:
+            async with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls(**kwargs)
+        return cls._instance
+
+    @classmethod
+    def enable_eager_tasks(cls) -> bool:
+        """
+        Sets the running event loop's task factory to asyncio.eager_task_factory
+        (Python 3.12+), so every Task created on that loop starts eagerly.
+        Must be called from inside a running event loop.
+
+        Returns:
+            `bool`: True if the eager task factory was installed, False if this
+            Python version does not provide it.
+        """
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is None:
+            logger.warning("asyncio.eager_task_factory requires Python 3.12+. Keeping the default task factory.")
+            return False
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+        return True
+
+    def _bind_loop(self):
+        """
+        Creates the lock and semaphore for the running event loop, or re-creates them
+        when notify() is called from a different loop (e.g. a second asyncio.run()).
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._init_lock = asyncio.Lock()
+            self._sem = asyncio.Semaphore(self.batch_size)
+
+    async def _ensure_initialized(self):
+        """
+        Initializes the underlying Bot (or aiohttp session) on first use. Guarded by
+        a lock so that concurrent notify() calls only initialize it once.
+        """
+        if self._initialized:
+            return
+        async with self._init_lock:
+            if not self._initialized:
+                if self.backend == "aiohttp":
+                    self._session = aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(limit=self._pool_size, ttl_dns_cache=300),
+                        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT),
+                    )
+                else:
+                    await self.bot.initialize()
+                self._initialized = True
+
+    async def aclose(self):
+        """
+        Shuts down the underlying Bot (or aiohttp session) and releases its HTTP connection pool.
+        Closing the process-wide instance makes the next get() build a new one.
+        """
+        if self._initialized:
+            if self.backend == "aiohttp":
+                await self._session.close()
+                self._session = None
+            else:
+                await self.bot.shutdown()
+            self._initialized = False
+        if self is type(self)._instance:
+            type(self)._instance = None
+
     async def notify(self, message: str, level: int = 1):
         """
         Send a formatted notification message to all subscribed and allowed chats.
         This coroutine sends `message` to every chat ID listed in self.allowed_chat_ids.
         The function validates the provided `level`, maps it to a short emoji-prefixed
         status header, prepends that header to the message body, and dispatches the
-        messages concurrently using asyncio.gather.
+        messages in batches of `batch_size`, each batch sent concurrently using asyncio.gather.
+        Every single send is bounded by `send_timeout` seconds.
         
         Params:
             `message (str)`: The core text to send in the notification body.
@@ -113,9 +418,8 @@ class TelegramNotifier:
         Returns:
             None
         Raises:
-            `Exception`: Any exception raised by the underlying send tasks (self._send_single_message)
-            will propagate from asyncio.gather. The first encountered exception is raised
-            to the caller.
+            Nothing for failed sends: errors and timeouts for a single chat ID are logged by
+            self._send_single_message and do not stop the other sends.
         Examples:
             Basic usage (from an async context and running inside a synchronous event loop (e.g., Jupyter notebooks)):
 
@@ -139,54 +443,181 @@ class TelegramNotifier:
               "ℹ️ [INFO]", "⚠️ [WARNING]", "❌ [ERROR]".
             - The function logs the number of destinations before sending and logs when all
               notifications have been sent.
+            - The message is sent with Markdown parse mode only if it contains Markdown
+              characters (*, _, `, [); otherwise it is sent as plain text.
         """
-        if not isinstance(level, int) or level not in [1, 2, 3]:
-            logger.warning(f"Invalid notification level '{level}'. Defaulting to 1 (Info).")
+        # Accept any object (e.g. an exception) as the message, like the f-string formatting did.
+        message = str(message)
+        prefix = _PREFIXES.get(level) if isinstance(level, int) else None
+        if prefix is None:
+            logger.warning("Invalid notification level '%s'. Defaulting to 1 (Info).", level)
+            prefix = _PREFIXES[1]
             level = 1
 
-        prefix = ""
-        if level == 1:
-            prefix = "ℹ️ [INFO]"
-        elif level == 2:
-            prefix = "⚠️ [WARNING]"
-        elif level == 3:
-            prefix = "❌ [ERROR]"
-            
-        full_message = f"{prefix}\n\n{message}"
-        
-        logger.info(f"Sending notification (Level {level}) to {len(self.allowed_chat_ids)} destination(s).")
+        full_message = prefix + "\n\n" + message
+        # Only the body is checked: the prefix's "[INFO]" is not a link and renders the same either way.
+        parse_mode = 'Markdown' if _MD_RE.search(message) else None
+        # The direct-HTTP backend serializes the shared part of the request once, not per recipient.
+        body = _encode_message_body(full_message, parse_mode) if self.backend == "aiohttp" else None
+
+        self._bind_loop()
+        await self._ensure_initialized()
+
+        recipients = self.allowed_chat_ids
+        skipped_ids = []
+        if self._blackhole:
+            # Single pass with one clock read, so each chat is either sent to or skipped.
+            now = time.monotonic()
+            recipients = []
+            for chat_id in self.allowed_chat_ids:
+                if self._should_skip(chat_id, now):
+                    skipped_ids.append(chat_id)
+                else:
+                    recipients.append(chat_id)
+        skipped = len(skipped_ids)
 
-        tasks = [
-            self._send_single_message(chat_id, full_message) 
-            for chat_id in self.allowed_chat_ids
-        ]
-        await asyncio.gather(*tasks)
-        logger.info("All notifications sent.")
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            if skipped:
+                logger.info("Skipping %s destination(s) that blocked the bot or do not exist: %s", skipped, skipped_ids)
+            logger.info("Sending notification (Level %s) to %s destination(s).", level, len(recipients))
+
+        for index, chunk in enumerate(_chunked(recipients, self.batch_size)):
+            if index:
+                await asyncio.sleep(self.delay_between_batches)
+            # gather() cancels the sends if notify() itself is cancelled.
+            await asyncio.gather(*(
+                _spawn(self._send_single_message(chat_id, full_message, parse_mode, body))
+                for chat_id in chunk
+            ))
+        if log_info:
+            if skipped:
+                logger.info("All notifications sent (%s destination(s) skipped).", skipped)
+            else:
+                logger.info("All notifications sent.")
+
+    def notify_threadsafe(self, message: str, level: int = 1, *, loop: asyncio.AbstractEventLoop):
+        """
+        Schedules notify() on `loop` from another thread without waiting for it
+        (fire-and-forget). Errors are logged by notify() and never reach the caller.
+
+        This uses loop.call_soon_threadsafe() + loop.create_task() rather than
+        asyncio.run_coroutine_threadsafe(), which would also build a
+        concurrent.futures.Future to hand a result back that nobody reads.
+
+        Params:
+            `message (str)`: The core text to send in the notification body.
+            `level (int, optional)`: Importance/risk level of the message, see notify(). Defaults to 1.
+            `loop (asyncio.AbstractEventLoop)`: The running event loop that owns this notifier.
+
+        Returns:
+            None
+
+        Notes:
+            - When already inside the event loop, do not use this method: call
+              `await notifier.notify(...)` directly, never wrapped in asyncio.run() or
+              asyncio.run_coroutine_threadsafe().
+        """
+        def _schedule():
+            task = loop.create_task(self.notify(message, level))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+        loop.call_soon_threadsafe(_schedule)
+
+    async def _post_message(self, chat_id: Union[str, int], text: str, parse_mode: Optional[str], body: Optional[bytes] = None):
+        """
+        Sends one message through the configured backend. Bot API errors returned to
+        the aiohttp backend are raised as the matching telegram.error exception, so
+        callers handle both backends the same way. `body` is the pre-encoded output of
+        _encode_message_body() and is only used by the aiohttp backend.
+        """
+        if self.backend == "ptb":
+            await self.bot.send_message(chat_id=chat_id, text=text, parse_mode=parse_mode)
+            return
+
+        if body is None:
+            body = _encode_message_body(text, parse_mode)
+        data = b'{"chat_id":' + _json_dumps(chat_id) + body
+        try:
+            async with self._session.post(self._api_url, data=data, headers=_JSON_HEADERS) as response:
+                data = await response.json()
+        except aiohttp.ClientError as e:
+            raise NetworkError(str(e)) from e
+
+        if data.get("ok"):
+            return
+        description = data.get("description", "Unknown error")
+        error_code = data.get("error_code")
+        if error_code == 429:
+            raise RetryAfter(data.get("parameters", {}).get("retry_after", 1))
+        if error_code == 403:
+            raise Forbidden(description)
+        if error_code == 400:
+            raise BadRequest(description)
+        raise TelegramError(description)
+
+    def _should_skip(self, chat_id: Union[str, int], now: Optional[float] = None) -> bool:
+        """
+        True while `chat_id` is cooling down after it blocked the bot or was not found.
+        `now` is a time.monotonic() reading; the clock is read if it is not given.
+        """
+        if now is None:
+            now = time.monotonic()
+        return now < self._blackhole.get(chat_id, 0.0)
+
+    def _mark_dead(self, chat_id: Union[str, int]):
+        """
+        Skips `chat_id` for DEAD_CHAT_COOLDOWN seconds after a failure that will not go
+        away by retrying (bot blocked or removed, chat not found).
+        """
+        self._blackhole[chat_id] = time.monotonic() + DEAD_CHAT_COOLDOWN
+        logger.warning("Skipping chat_id %s for the next %ss.", chat_id, DEAD_CHAT_COOLDOWN)
 
-    async def _send_single_message(self, chat_id: Union[str, int], text: str):
+    async def _send_single_message(self, chat_id: Union[str, int], text: str, parse_mode: Optional[str] = 'Markdown', body: Optional[bytes] = None):
         """
         A helper function to send a message to a single chat ID with error handling.
-        This function requires no changes, as the library handles both string and int IDs.
+        If Telegram answers with RetryAfter (HTTP 429), waits the requested time and
+        re-sends the message exactly once. Each attempt is bounded by `send_timeout`.
+        A chat that blocked the bot or does not exist is skipped by notify() for a while.
         """
         try:
-            await self.bot.send_message(chat_id=chat_id, text=text, parse_mode='Markdown')
-            logger.info(f"Successfully sent message to chat_id: {chat_id}")
+            async with self._sem:
+                try:
+                    await asyncio.wait_for(self._post_message(chat_id, text, parse_mode, body), self.send_timeout)
+                except RetryAfter as e:
+                    retry_after = e.retry_after
+                    if isinstance(retry_after, timedelta):
+                        retry_after = retry_after.total_seconds()
+                    logger.warning("Rate limited while sending to chat_id %s. Retrying in %ss.", chat_id, retry_after)
+                    await asyncio.sleep(retry_after)
+                    await asyncio.wait_for(self._post_message(chat_id, text, parse_mode, body), self.send_timeout)
+            self._blackhole.pop(chat_id, None)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Successfully sent message to chat_id: %s", chat_id)
+        except asyncio.TimeoutError:
+            logger.error("Timed out after %ss while sending to chat_id %s.", self.send_timeout, chat_id)
         except TelegramError as e:
-            logger.error(f"Failed to send message to chat_id {chat_id}: {e}")
+            logger.error("Failed to send message to chat_id %s: %s", chat_id, e)
+            # Only errors specific to this chat; other failures may hit every recipient.
+            if isinstance(e, Forbidden) or (isinstance(e, BadRequest) and "chat not found" in str(e).lower()):
+                self._mark_dead(chat_id)
         except Exception as e:
-            logger.error(f"An unexpected error occurred while sending to {chat_id}: {e}")
+            logger.error("An unexpected error occurred while sending to %s: %s", chat_id, e)
 
-# The main function for testing remains the same.
+# Example entry point: sends a test notification through the process-wide notifier.
 async def main():
     print("--- Running Notifier Example ---")
     try:
-        notifier = TelegramNotifier()
+        notifier = await TelegramNotifier.get()
         await notifier.notify("This is a test notification to the configured channels and users.", level=1)
+        await notifier.aclose()
     except ValueError as e:
         print(f"Configuration Error: {e}")
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     asyncio.run(main())
 